@@ -1,31 +1,66 @@
 from __future__ import annotations
 
-import json
+import contextlib
 import os
+import shlex
 import subprocess
 import time
+import weakref
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
-from typing import Any, TypedDict
-
-from .helpers import get_podman_exe
+from typing import Any, TypedDict, cast
+
+from .helpers import (
+    PODMAN_SOCKET,
+    demux_log_stream,
+    get_podman_exe,
+    podman_rest_get,
+    spawn_capture,
+)
 from .preflight import run_preflight_checks
 
+_loads: Callable[[str | bytes], Any]
+try:  # 3-5x faster C parser for podman's KB-scale inspect payloads
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 __all__ = ["Container", "ContainerConfig"]
 
 
+def _finalize_stop(id_box: list[str | None], env: dict[str, str] | None) -> None:
+    """Best-effort teardown for containers leaked without stop().
+
+    Runs from weakref.finalize, so it must not reference the Container —
+    the id travels in a mutable box that start()/stop() keep up to date.
+    """
+    if id_box[0] is None:
+        return
+    with contextlib.suppress(Exception):
+        subprocess.run(  # noqa: S603
+            [get_podman_exe(), "rm", "-f", "-t", "0", id_box[0]],
+            capture_output=True,
+            check=False,
+            env=env,
+        )
+
+
 class _Port_Binding(TypedDict):
     HostIp: str
     HostPort: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ContainerConfig:
     """Generic container configuration.
 
     Key features:
     - ``init_dir`` + ``init_scripts`` → auto-mounted to official init directory
-      with ``00-``, ``01-`` prefix for correct execution order.
+      with ``00-``, ``01-`` prefix for correct execution order. Scripts are
+      mounted in the order given — callers own the ordering, nothing re-sorts.
     - ``volumes`` → arbitrary additional mounts
     - ``ports`` → auto-bind if ``None``
     - ``health_cmd`` → wait-for-ready
@@ -38,7 +73,7 @@ class ContainerConfig:
     ports: dict[int, int | None] | None = None  # {internal: host | None}
     env: dict[str, str] | None = None
     init_dir: str | None = None  # e.g. "/docker-entrypoint-initdb.d"
-    init_scripts: list[Path] | None = None  # auto-named 00-, 01-
+    init_scripts: list[Path] | None = None  # mounted in list order, auto-named 00-, 01-
     volumes: dict[Path, str] | None = None  # host → container
     health_cmd: list[str] | None = None
     command: list[str] | None = None
@@ -48,29 +83,73 @@ class ContainerConfig:
 class Container:
     """Lifecycle-managed Podman container with context manager support."""
 
-    _podman_exe: str | None = None
-
     _checked_env: bool = False
 
+    _live: weakref.WeakSet[Container] = weakref.WeakSet()
+
     def _run_preflight_checks(self) -> None:
         if not Container._checked_env:
             run_preflight_checks()
             Container._checked_env = True
 
-    def __init__(self, config: ContainerConfig):
-        """Initialize a container."""
+    def __init__(
+        self,
+        config: ContainerConfig,
+        runner: Callable[..., subprocess.CompletedProcess[Any]] | None = None,
+    ):
+        """Initialize a container.
+
+        ``runner`` swaps the process launcher (a ``subprocess.run``
+        equivalent) — tests inject a fake instead of patching the
+        subprocess module globally.
+        """
         self.config = config
-        self.container_id: str | None = None
+        self._runner = runner
+        self._id_box: list[str | None] = [None]
         self._ports: dict[int, list[_Port_Binding]] | None = None
+        self._status: str | None = None
+        self._exec_prefix: tuple[str, str, str] | None = None
+        self._inspect_prefix: tuple[str, str, str] | None = None
+        self._finalizer = weakref.finalize(self, _finalize_stop, self._id_box, self._get_env())
+
+    @property
+    def container_id(self) -> str | None:
+        """ID of the running container, or None when stopped."""
+        return self._id_box[0]
+
+    @container_id.setter
+    def container_id(self, value: str | None) -> None:
+        self._id_box[0] = value
+        self._exec_prefix = None
+        self._inspect_prefix = None
+
+    def _get_exec_prefix(self) -> tuple[str, str, str]:
+        """Argv head for exec calls, built once per container id."""
+        if self._exec_prefix is None:
+            self._exec_prefix = (self._get_podman(), "exec", str(self.container_id))
+        return self._exec_prefix
+
+    def _get_inspect_prefix(self) -> tuple[str, str, str]:
+        """Argv head for inspect calls, built once per container id."""
+        if self._inspect_prefix is None:
+            self._inspect_prefix = (self._get_podman(), "inspect", str(self.container_id))
+        return self._inspect_prefix
 
     # --------------------------------------------------------------------- #
     # Podman executable
     # --------------------------------------------------------------------- #
     def _get_podman(self) -> str:
-        if Container._podman_exe is None:
-            exe = get_podman_exe()
-            Container._podman_exe = exe
-        return Container._podman_exe
+        return get_podman_exe()
+
+    def _run(self, *args: Any, **kwargs: Any) -> subprocess.CompletedProcess[Any]:
+        """Dispatch to the injected runner, defaulting to subprocess.run.
+
+        The default is resolved per call so test-time patches on the
+        subprocess module still take effect.
+        """
+        if self._runner is not None:
+            return self._runner(*args, **kwargs)
+        return subprocess.run(*args, **kwargs)  # noqa: S603
 
     def _get_env(self) -> dict[str, str] | None:
         """Return environment variables with PODMAN_HOST if set."""
@@ -78,6 +157,22 @@ class Container:
             return {**os.environ, "PODMAN_HOST": self.config.podman_host}
         return None
 
+    def _rest_get(self, path: str) -> bytes | None:
+        """GET a libpod REST path; None when the socket path is unusable.
+
+        Avoids forking the podman CLI for read-only queries. Returns None
+        when no local socket exists or the container targets a remote host,
+        so callers fall back to the subprocess path.
+        """
+        if self.config.podman_host or PODMAN_SOCKET is None:
+            return None
+        try:
+            return podman_rest_get(path, PODMAN_SOCKET)
+        except (OSError, RuntimeError):
+            # RuntimeError covers non-2xx answers (e.g. 404 for a container
+            # that just died) — those should hit the CLI path, not the caller.
+            return None
+
     def inspect_port_mappings(self) -> dict[int, list[_Port_Binding]]:
         """Run `podman inspect` once and return a clean {container_port: host_port} dict."""
         if self._ports is not None:
@@ -86,28 +181,58 @@ class Container:
         if not self.container_id:
             raise RuntimeError("Container must be started before calling get_port")
 
-        output = subprocess.check_output(  # noqa: S603
-            [
-                self._get_podman(),
-                "inspect",
-                self.container_id,
-                "--format",
-                "{{json .NetworkSettings.Ports}}",
-            ],
-            text=True,
+        output = spawn_capture(
+            [*self._get_inspect_prefix(), "--format", "{{json .NetworkSettings.Ports}}"],
             env=self._get_env(),
-        ).strip()
+            check=True,
+        ).stdout.strip()
 
-        raw_ports = {} if output == "null" else json.loads(output)
+        raw_ports = {} if output == "null" else _loads(output)
 
+        self._ports = self._parse_ports(raw_ports)
+        return self._ports
+
+    @staticmethod
+    def _parse_ports(raw_ports: dict[str, Any]) -> dict[int, list[_Port_Binding]]:
+        """Convert podman's port spec keys ("80/tcp") to integer container ports."""
         ports: dict[int, list[_Port_Binding]] = {}
         for port_spec, bindings in raw_ports.items():
             container_port = int(port_spec.split("/")[0])  # "80/tcp" → 80
             ports[container_port] = bindings
-
-        self._ports = ports
         return ports
 
+    @classmethod
+    def _bulk_refresh(cls, containers: list[Container] | None = None) -> None:
+        """Refresh the port/status caches of many containers with one inspect.
+
+        Runs a single ``podman container inspect id1 id2 ...`` instead of one
+        subprocess per container. Defaults to every live (started) container.
+        Assumes all targets talk to the same podman endpoint.
+        """
+        candidates = containers if containers is not None else cls._live
+        targets = [c for c in candidates if c.container_id]
+        if not targets:
+            return
+
+        output = subprocess.check_output(  # noqa: S603
+            [
+                targets[0]._get_podman(),
+                "container",
+                "inspect",
+                *[c.container_id for c in targets if c.container_id],
+            ],
+            text=True,
+            env=targets[0]._get_env(),
+        ).strip()
+
+        by_id = {record["Id"]: record for record in _loads(output)}
+        for container in targets:
+            record = by_id.get(container.container_id or "")
+            if record is None:
+                continue
+            container._ports = cls._parse_ports(record["NetworkSettings"].get("Ports") or {})
+            container._status = record["State"]["Status"]
+
     def get_port(self, internal_port: int) -> int | None:
         """Return the host port mapped to the given internal port."""
         mappings = self.inspect_port_mappings()
@@ -128,40 +253,57 @@ class Container:
             self._get_podman(),
             "run",
             "-d",
+            "--replace",  # atomically remove any stale container with this name
             "--name",
             self.config.name,
         ]
 
-        # Ports
+        # Ports — a None host delegates allocation to podman itself ("-p :80"),
+        # so there is no bind/close/rebind window for another process to steal
+        # the port. Never pre-probe free ports on the host here.
         for internal, host in (self.config.ports or {}).items():
             host_port = host if host is not None else ""
-            cmd += ["-p", f"{host_port}:{internal}"]
+            cmd.extend(("-p", f"{host_port}:{internal}"))
 
         # Environment
-        for k, v in (self.config.env or {}).items():
-            cmd += ["-e", f"{k}={v}"]
+        if self.config.env:
+            cmd.extend(chain.from_iterable(("-e", f"{k}={v}") for k, v in self.config.env.items()))
 
         # === INIT SCRIPTS: auto-mount to init_dir with 00-, 01- prefix ===
         if self.config.init_dir and self.config.init_scripts:
             init_dir = self.config.init_dir.rstrip("/")
-            # Sort for deterministic order
             for i, script_path in enumerate(self.config.init_scripts):
                 if not script_path.is_file():
                     raise FileNotFoundError(f"Init script not found: {script_path}")
-                filename = f"{i:02d}-{script_path.name}"
-                container_path = f"{init_dir}/{filename}"
-                cmd += ["-v", f"{script_path}:{container_path}:ro"]
+                # Stringify once — argv needs str, not Path semantics
+                script_str = str(script_path)
+                container_path = f"{init_dir}/{i:02d}-{script_path.name}"
+                cmd.extend(("-v", f"{script_str}:{container_path}:ro"))
 
         # === GENERAL VOLUMES ===
         for host_path, container_path in (self.config.volumes or {}).items():
-            cmd += ["-v", f"{host_path}:{container_path}"]
+            host_str = str(host_path)
+            cmd.extend(("-v", f"{host_str}:{container_path}"))
+
+        # === HEALTH CHECK: delegate to podman's built-in healthchecker ===
+        if self.config.health_cmd:
+            retries = max(1, int(self.config.health_timeout / self.config.health_interval))
+            cmd.extend(
+                (
+                    "--health-cmd",
+                    shlex.join(self.config.health_cmd),
+                    f"--health-interval={self.config.health_interval}s",
+                    f"--health-retries={retries}",
+                    f"--health-start-period={self.config.health_timeout}s",
+                )
+            )
 
         # Image
         cmd.append(self.config.image)
 
         # Command override
         if self.config.command:
-            cmd += [*self.config.command]
+            cmd.extend(self.config.command)
 
         return cmd
 
@@ -171,17 +313,19 @@ class Container:
     def start(self) -> Container:
         """Start container and wait for health check."""
         self._run_preflight_checks()
-        self.stop()
+        if self.container_id:
+            self.stop()
+        run_cmd = self._build_run_cmd()  # built once, reused in the error path
         try:
-            result = subprocess.run(  # noqa: S603
-                self._build_run_cmd(),
+            result = self._run(
+                run_cmd,
                 capture_output=True,
                 text=True,
                 check=True,
                 env=self._get_env(),
             )
         except subprocess.CalledProcessError as e:
-            cmd_str = " ".join(self._build_run_cmd())
+            cmd_str = " ".join(run_cmd)
             raise RuntimeError(
                 f"Failed to start container {self.config.name!r}:\n"
                 f"Command: {cmd_str}\n"
@@ -194,32 +338,131 @@ class Container:
         if not self.container_id:
             raise RuntimeError("Container started but no ID returned")
 
+        Container._live.add(self)
         self._wait_for_ready()
+        if self.config.ports:
+            # Warm the cache so every get_port call is a dict lookup.
+            self.inspect_port_mappings()
         return self
 
+    def is_running(self) -> bool:
+        """Cheap liveness check.
+
+        'podman ps -q' with filters skips loading and serializing the full
+        container record that check_status pays for via inspect.
+        """
+        if not self.container_id:
+            return False
+        result = spawn_capture(
+            [
+                self._get_podman(),
+                "ps",
+                "--filter",
+                f"id={self.container_id}",
+                "--filter",
+                "status=running",
+                "-q",
+            ],
+            env=self._get_env(),
+        )
+        return bool(result.stdout.strip())
+
+    @classmethod
+    def start_many(cls, containers: list[Container], max_workers: int = 8) -> list[Container]:
+        """Start many containers in parallel and wait for all to be ready.
+
+        The bottleneck per container is subprocess I/O and health waiting,
+        so threads overlap N startups into roughly the slowest one. If any
+        container fails, the ones that did start are stopped before the
+        first error is re-raised.
+        """
+        if not containers:
+            return containers
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(containers))) as pool:
+            futures = {pool.submit(c.start): c for c in containers}
+            errors: list[Exception] = []
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors.append(e)
+        if errors:
+            for container in containers:
+                if container.container_id:
+                    container.stop()
+            raise errors[0]
+        return containers
+
     def check_status(self) -> str:
         """Check container status."""
         if not self.container_id:
             return "Not running"
 
-        result = subprocess.run(  # noqa: S603
-            [self._get_podman(), "inspect", self.container_id, "--format", "{{.State.Status}}"],
-            capture_output=True,
-            text=True,
+        if self._status is not None:
+            return self._status
+
+        body = self._rest_get(f"/v4.0.0/libpod/containers/{self.container_id}/json")
+        if body is not None:
+            return str(_loads(body)["State"]["Status"])
+
+        result = spawn_capture(
+            [*self._get_inspect_prefix(), "--format", "{{.State.Status}}"],
             env=self._get_env(),
         )
 
         return result.stdout.strip()
 
     def _wait_for_ready(self) -> None:
-        """Poll health_cmd until success or timeout."""
+        """Block on podman's healthchecker until healthy or timeout."""
+        if not self.config.health_cmd or not self.container_id:
+            return
+        try:
+            result = self._run(
+                # --interval tightens podman's internal state poll (default
+                # 250ms) so fast services are detected within ~25ms.
+                [
+                    self._get_podman(),
+                    "wait",
+                    "--condition=healthy",
+                    "--interval",
+                    "25ms",
+                    self.container_id,
+                ],
+                capture_output=True,
+                check=False,
+                timeout=self.config.health_timeout,
+                env=self._get_env(),
+            )
+        except subprocess.TimeoutExpired as e:
+            raise TimeoutError(
+                f"Container {self.config.name} did not become ready "
+                f"in {self.config.health_timeout}s"
+            ) from e
+        if result.returncode:
+            stderr = result.stderr
+            stderr_text = (
+                stderr.decode(errors="replace") if isinstance(stderr, bytes) else str(stderr or "")
+            )
+            # podman < 4.6 rejects the healthy condition; those releases
+            # still pass the 4.0 preflight floor, so poll health_cmd the
+            # way pre-healthchecker versions of this method did.
+            if "condition" in stderr_text:
+                self._poll_for_ready()
+                return
+            raise RuntimeError(
+                f"Waiting on container {self.config.name} failed:\n{result.stderr!r}"
+            )
+
+    def _poll_for_ready(self) -> None:
+        """Exec health_cmd in a sleep loop — fallback for podman < 4.6."""
         if not self.config.health_cmd or not self.container_id:
             return
-        deadline = time.time() + (self.config.health_timeout)
-        while time.time() < deadline:
-            result = subprocess.run(  # noqa: S603
-                [self._get_podman(), "exec", self.container_id, *self.config.health_cmd],
+        deadline = time.monotonic() + self.config.health_timeout
+        while time.monotonic() < deadline:
+            result = self._run(
+                [*self._get_exec_prefix(), *self.config.health_cmd],
                 capture_output=True,
+                check=False,
                 env=self._get_env(),
             )
             if result.returncode == 0:
@@ -233,50 +476,68 @@ class Container:
         """Stop and remove container."""
         if not self.container_id:
             return
-        subprocess.run(  # noqa: S603
-            [self._get_podman(), "stop", self.container_id],
-            capture_output=True,
-            check=False,
-            env=self._get_env(),
-        )
-        subprocess.run(  # noqa: S603
-            [self._get_podman(), "rm", "-f", self.container_id],
+        # rm -f stops the container itself; -t 0 skips the SIGTERM grace
+        # period, which throwaway test containers don't need.
+        self._run(
+            [self._get_podman(), "rm", "-f", "-t", "0", self.container_id],
             capture_output=True,
             check=False,
             env=self._get_env(),
         )
+        Container._live.discard(self)
         self.container_id = None
         self._ports = None
+        self._status = None
 
     def exec(self, cmd: list[str]) -> subprocess.CompletedProcess[str]:
         """Run command inside container."""
         if not self.container_id:
             raise RuntimeError("Container not started")
-        try:
-            return subprocess.run(  # noqa: S603
-                [self._get_podman(), "exec", self.container_id, *cmd],
-                check=True,
-                capture_output=True,
-                text=True,
-                env=self._get_env(),
-            )
-        except subprocess.CalledProcessError as e:
+        result = self._run(
+            [*self._get_exec_prefix(), *cmd],
+            check=False,
+            capture_output=True,
+            text=True,
+            env=self._get_env(),
+        )
+        if result.returncode:
             raise RuntimeError(
                 f"Command {' '.join(cmd)!r} failed in container {self.config.name}:\n"
-                f"stdout: {e.stdout}\nstderr: {e.stderr}"
-            ) from e
+                f"stdout: {result.stdout}\nstderr: {result.stderr}"
+            )
+        return result
+
+    def logs(
+        self, follow: bool = False, tail: int | None = None, binary: bool = False
+    ) -> str | bytes:
+        """Get the container logs.
 
-    def logs(self, follow: bool = False, tail: int | None = None) -> str:
-        """Get the container logs."""
+        With ``binary=True`` the raw bytes are returned undecoded — cheaper
+        for large pulls where the caller only searches for a marker.
+        """
         if not self.container_id:
             raise RuntimeError("Container not started")
+
+        if not follow:
+            path = f"/v4.0.0/libpod/containers/{self.container_id}/logs?stdout=true&stderr=true"
+            if tail:
+                path += f"&tail={tail}"
+            body = self._rest_get(path)
+            if body is not None:
+                data = demux_log_stream(body)
+                return data if binary else data.decode()
+
         cmd = [self._get_podman(), "logs"]
         if tail:
             cmd += ["--tail", str(tail)]
         if follow:
             cmd += ["-f"]
         cmd += [self.container_id]
-        return subprocess.check_output(cmd, text=True, env=self._get_env())  # noqa: S603
+        if binary:
+            result = self._run(cmd, stdout=subprocess.PIPE, check=True, env=self._get_env())
+            return cast(bytes, result.stdout)
+        result = self._run(cmd, stdout=subprocess.PIPE, text=True, check=True, env=self._get_env())
+        return cast(str, result.stdout)
 
     # --------------------------------------------------------------------- #
     # Context manager
@@ -295,11 +556,6 @@ class Container:
         """
         self.stop()
 
-    def __del__(self) -> None:
-        """Make sure to stop the container on cleanup."""
-        if self.container_id:
-            self.stop()
-
     def __repr__(self) -> str:
         """Return a string representation of the container."""
         status = "running" if self.container_id else "stopped"
@@ -1,4 +1,9 @@
+import functools
+import http.client
+import os
 import shutil
+import socket
+import subprocess
 import tempfile
 import warnings
 from collections.abc import Generator
@@ -6,9 +11,131 @@ from contextlib import contextmanager
 from pathlib import Path
 
 
+@functools.lru_cache(maxsize=1)
+def _resolved_podman() -> str | None:
+    """Cached $PATH walk for the podman binary (shared by all conftests)."""
+    return shutil.which("podman")
+
+
+@functools.lru_cache(maxsize=1)
+def _resolved_docker() -> str | None:
+    """Cached $PATH walk for a shadowing docker binary."""
+    return shutil.which("docker")
+
+
+# Resolved once at import so hot-path callers never re-walk $PATH.
+PODMAN_EXE: str | None = _resolved_podman()
+
+
+def get_podman_socket() -> str | None:
+    """Return the path of the podman API socket, or None if absent."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR") or f"/run/user/{os.getuid()}"
+    sock_path = os.path.join(runtime_dir, "podman", "podman.sock")
+    return sock_path if os.path.exists(sock_path) else None
+
+
+# Resolved once at import, like PODMAN_EXE.
+PODMAN_SOCKET: str | None = get_podman_socket()
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP connection over an AF_UNIX socket (podman's REST API transport)."""
+
+    def __init__(self, socket_path: str, timeout: float = 10.0):
+        super().__init__("localhost", timeout=timeout)
+        self._socket_path = socket_path
+
+    def connect(self) -> None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self._socket_path)
+        self.sock = sock
+
+
+def podman_rest_get(path: str, socket_path: str) -> bytes:
+    """GET a libpod REST path over the unix socket and return the raw body.
+
+    Raises:
+        RuntimeError: if the API answers with a non-2xx status.
+    """
+    conn = _UnixHTTPConnection(socket_path)
+    try:
+        conn.request("GET", path)
+        response = conn.getresponse()
+        body = response.read()
+        if response.status >= 300:
+            raise RuntimeError(f"podman API GET {path} failed: {response.status}")
+        return body
+    finally:
+        conn.close()
+
+
+def spawn_capture(
+    argv: list[str],
+    env: dict[str, str] | None = None,
+    check: bool = False,
+) -> subprocess.CompletedProcess[str]:
+    """Run a short-lived command via os.posix_spawnp, capturing its output.
+
+    subprocess.run with pipes falls back to fork(), whose page-table copy
+    dominates short commands in large parent processes; posix_spawn keeps
+    the cost constant. Output is read sequentially, so this is only meant
+    for commands with small (pipe-buffer-sized) output like inspect/ps.
+    """
+    out_read, out_write = os.pipe()
+    err_read, err_write = os.pipe()
+    try:
+        pid = os.posix_spawnp(
+            argv[0],
+            argv,
+            os.environ if env is None else env,
+            file_actions=[
+                (os.POSIX_SPAWN_DUP2, out_write, 1),
+                (os.POSIX_SPAWN_DUP2, err_write, 2),
+                (os.POSIX_SPAWN_CLOSE, out_read),
+                (os.POSIX_SPAWN_CLOSE, err_read),
+            ],
+        )
+    finally:
+        os.close(out_write)
+        os.close(err_write)
+
+    try:
+        stdout = b"".join(iter(lambda: os.read(out_read, 65536), b""))
+        stderr = b"".join(iter(lambda: os.read(err_read, 65536), b""))
+    finally:
+        os.close(out_read)
+        os.close(err_read)
+
+    _, status = os.waitpid(pid, 0)
+    returncode = os.waitstatus_to_exitcode(status)
+    if check and returncode != 0:
+        raise subprocess.CalledProcessError(
+            returncode, argv, output=stdout.decode(), stderr=stderr.decode()
+        )
+    return subprocess.CompletedProcess(argv, returncode, stdout.decode(), stderr.decode())
+
+
+def demux_log_stream(payload: bytes) -> bytes:
+    """Strip the docker-style multiplexing frames from a libpod log stream.
+
+    Non-tty containers interleave stdout/stderr as 8-byte-header frames;
+    tty containers stream raw bytes, which are returned unchanged.
+    """
+    if len(payload) < 8 or payload[0] not in (0, 1, 2) or payload[1:4] != b"\x00\x00\x00":
+        return payload
+    chunks = []
+    offset = 0
+    while offset + 8 <= len(payload):
+        frame_len = int.from_bytes(payload[offset + 4 : offset + 8], "big")
+        chunks.append(payload[offset + 8 : offset + 8 + frame_len])
+        offset += 8 + frame_len
+    return b"".join(chunks)
+
+
 def get_podman_exe() -> str:
     """Find podman executable."""
-    exe = shutil.which("podman")
+    exe = PODMAN_EXE or shutil.which("podman")
     if not exe:
         raise RuntimeError("podman not found in PATH")
 
@@ -1,19 +1,32 @@
 from __future__ import annotations
 
+import functools
 import os
+import platform
+import re
 import shutil
+import socket
 import subprocess
 import sys
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import NamedTuple
 
-from .helpers import get_podman_exe
+from .helpers import _resolved_docker, get_podman_exe, get_podman_socket
 
 
 def _podman_exe() -> str:
     return get_podman_exe()
 
 
+_VERSION_RE = re.compile(r"(\d+\.\d+)")
+
+# WSL never changes under a running process, so detect it once at import.
+# platform.release() is cached by CPython and spares the /proc/version read.
+_IS_WSL = "microsoft" in platform.release().lower()
+
+
 # --------------------------------------------------------------------------- #
 # Pretty failure printer
 # --------------------------------------------------------------------------- #
@@ -23,6 +36,40 @@ def _fail(msg: str) -> None:
     sys.exit(1)
 
 
+class _PodmanInfo(NamedTuple):
+    socket_exists: bool
+    graph_root: str
+    version: str
+
+
+@functools.lru_cache(maxsize=1)
+def _podman_info_bundle() -> _PodmanInfo | None:
+    """Fetch socket/storage/version state with a single podman fork.
+
+    Each podman invocation pays full Go-binary startup (~100-200ms), so
+    the three checks that need this data share one memoized call.
+    Returns None when podman itself cannot answer.
+    """
+    result = subprocess.run(  # noqa: S603
+        [
+            _podman_exe(),
+            "info",
+            "--format",
+            "{{.Host.RemoteSocket.Exists}}|{{.Store.GraphRoot}}|{{.Version.Version}}",
+        ],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    if result.returncode != 0:
+        return None
+    try:
+        socket_raw, graph_root, version = result.stdout.strip().split("|")
+    except ValueError:
+        return None
+    return _PodmanInfo(socket_exists=socket_raw == "true", graph_root=graph_root, version=version)
+
+
 # --------------------------------------------------------------------------- #
 # Individual checks
 # --------------------------------------------------------------------------- #
@@ -32,65 +79,64 @@ def _check_podman_in_path() -> None:
 
 
 def _check_podman_version() -> None:
-    result = subprocess.run(  # noqa: S603
-        [_podman_exe(), "--version"], capture_output=True, text=True, check=False
-    )
-    if result.returncode != 0:
+    info = _podman_info_bundle()
+    if info is None:
         return  # Already failed in PATH check
-    import re
-
-    match = re.search(r"(\d+\.\d+)", result.stdout)
+    match = _VERSION_RE.search(info.version)
     if not match:
         return
     version = tuple(map(int, match.group(1).split(".")))
     if version < (4, 0):
         _fail(
-            f"podman >= 4.0 required, found {result.stdout.strip()}\n"
+            f"podman >= 4.0 required, found {info.version}\n"
             "Upgrade your system packages or use a newer image in CI"
         )
 
 
+_SOCKET_FAIL_MSG = (
+    "Podman socket not running\n"
+    "On Linux: systemctl --user start podman.socket\n"
+    "On macOS/WSL: podman machine init && podman machine start"
+)
+
+
 def _check_podman_socket() -> None:
-    result = subprocess.run(  # noqa: S603
-        [_podman_exe(), "info", "--format", "{{.Host.RemoteSocket.Exists}}"],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if result.returncode != 0 or result.stdout.strip() != "true":
-        _fail(
-            "Podman socket not running\n"
-            "On Linux: systemctl --user start podman.socket\n"
-            "On macOS/WSL: podman machine init && podman machine start"
-        )
+    # A raw connect() answers "is anyone listening?" in microseconds,
+    # versus ~150ms of Go-binary startup for 'podman info'.
+    socket_path = get_podman_socket()
+    if socket_path is None:
+        # Machine-mode setups (macOS/WSL) have no guessable UDS path;
+        # fall back to asking podman itself.
+        info = _podman_info_bundle()
+        if info is None or not info.socket_exists:
+            _fail(_SOCKET_FAIL_MSG)
+        return
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(0.5)
+            sock.connect(socket_path)
+    except OSError:
+        _fail(_SOCKET_FAIL_MSG)
 
 
 def _check_storage_writable() -> None:
-    result = subprocess.run(  # noqa: S603
-        [_podman_exe(), "info", "--format", "{{.Store.GraphRoot}}"],
-        capture_output=True,
-        text=True,
-        check=False,
-    )
-    if result.returncode != 0:
+    info = _podman_info_bundle()
+    if info is None:
         return
-    graph_root = Path(result.stdout.strip())
+    graph_root = Path(info.graph_root)
     if not graph_root.exists():
         _fail(f"Podman storage path missing: {graph_root}")
-    test_file = graph_root / ".podman-test-write"
-    try:
-        test_file.write_text("test")
-        test_file.unlink()
-    except Exception as e:
+    # One faccessat syscall instead of a write-then-unlink probe that
+    # touched the storage filesystem's journal on every session.
+    if not os.access(graph_root, os.W_OK):
         _fail(
             f"Podman storage not writable: {graph_root}\n"
-            f"Error: {e}\n"
             "Fix: chown $USER -R ~/.local/share/containers"
         )
 
 
 def _check_docker_conflict() -> None:
-    if shutil.which("docker") and not os.environ.get("PODMAN_IGNORE_DOCKER"):
+    if _resolved_docker() and not os.environ.get("PODMAN_IGNORE_DOCKER"):
         _fail(
             "'docker' CLI found in PATH — may shadow 'podman'\n"
             "Fix:\n"
@@ -100,13 +146,10 @@ def _check_docker_conflict() -> None:
 
 
 def _check_wsl_shm() -> None:
-    proc_path = Path("/proc/version")
-    if not proc_path.exists():
-        return  # Not Linux → not WSL
-    proc = proc_path.read_text().lower()
-    if "microsoft" not in proc:
-        return  # Not WSL
-    shm_size = Path("/dev/shm").stat().st_size  # noqa: S108
+    if not _IS_WSL:
+        return
+    stats = os.statvfs("/dev/shm")  # noqa: S108
+    shm_size = stats.f_blocks * stats.f_frsize
     if shm_size < 64 * 1024 * 1024:  # < 64MB
         _fail(
             f"WSL2: /dev/shm too small ({shm_size // 1024 // 1024}MB)\n"
@@ -133,22 +176,75 @@ def _check_snap_sandbox() -> None:
 # --------------------------------------------------------------------------- #
 # Public API
 # --------------------------------------------------------------------------- #
+# Cheap in-process checks first: a misconfigured host fails in
+# microseconds instead of after a round of podman forks.
 CHECKS: list[Callable[[], None]] = [
-    _check_snap_sandbox,
     _check_podman_in_path,
-    _check_podman_version,
-    _check_podman_socket,
-    _check_storage_writable,
+    _check_snap_sandbox,
     _check_docker_conflict,
     _check_wsl_shm,
+    _check_podman_socket,
+    _check_podman_version,
+    _check_storage_writable,
 ]
 
 
+# Checks that fork podman; everything else is near-free pure Python.
+# The socket check is a raw connect() and lives in the cheap tier.
+_SUBPROCESS_CHECKS: frozenset[Callable[[], None]] = frozenset(
+    {_check_podman_version, _check_storage_writable}
+)
+
+
+# The environment does not change mid-session, so a full pass only has to
+# happen once per process no matter how many fixtures call us.
+_PREFLIGHT_DONE = False
+
+
+def reset_preflight_cache() -> None:
+    """Forget previous preflight results so the next call re-probes."""
+    global _PREFLIGHT_DONE
+    _PREFLIGHT_DONE = False
+    _podman_info_bundle.cache_clear()
+
+
 def run_preflight_checks(custom_checks: list[Callable[[], None]] | None = None) -> None:
-    """Runtime environment checks for Podman-based tests."""
+    """Runtime environment checks for Podman-based tests.
+
+    Cheap in-process checks run serially first; the subprocess-backed
+    probes are independent I/O waits, so they run concurrently and the
+    preflight costs roughly one podman startup instead of three.
+    Repeat calls without ``custom_checks`` are free: the first clean pass
+    sets ``_PREFLIGHT_DONE`` and later ones return immediately.
+    """
+    global _PREFLIGHT_DONE
+    if _PREFLIGHT_DONE and custom_checks is None:
+        return
     all_checks = CHECKS + (custom_checks or [])
+    forking = [check for check in all_checks if check in _SUBPROCESS_CHECKS]
     for check in all_checks:
+        if check in _SUBPROCESS_CHECKS:
+            continue
         try:
             check()
         except Exception as e:
             _fail(str(e))
+
+    if not forking:
+        _PREFLIGHT_DONE = True
+        return
+    # Prime the shared bundle once — lru_cache has no lock, so letting the
+    # workers race the first call could fork podman several times.
+    _podman_info_bundle()
+    with ThreadPoolExecutor(max_workers=len(forking)) as pool:
+        futures = [pool.submit(check) for check in forking]
+        try:
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    _fail(str(e))
+        except BaseException:
+            pool.shutdown(wait=False, cancel_futures=True)
+            raise
+    _PREFLIGHT_DONE = True
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
-import shutil
+import json
+import os
 import subprocess
 from collections.abc import Generator
 from pathlib import Path
+from urllib.parse import quote
 
 import pytest
 
-from podman_runner.helpers import tmp_path_factory_safe
+from podman_runner.helpers import (
+    _resolved_podman,
+    get_podman_socket,
+    podman_rest_get,
+    tmp_path_factory_safe,
+)
 
-podman_path = shutil.which("podman")
+podman_path = _resolved_podman()
 if not podman_path:
     raise RuntimeError(
         "\n'podman' executable not found in PATH.\n"
@@ -21,6 +28,15 @@ PODMAN_EXE = podman_path
 TEST_CONTAINER_PREFIX = "podman-runner-integration-test"
 
 
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--examples-subprocess",
+        action="store_true",
+        default=False,
+        help="Run each examples/*.py in a fresh 'uv run' subprocess instead of in-process",
+    )
+
+
 @pytest.fixture(scope="session")
 def podman_exe() -> str:
     """Expose PODMAN_EXE for testing session."""
@@ -40,7 +56,7 @@ def tmp_path() -> Generator[Path, None, None]:
         yield session_tmp_path
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def tmp_init_dir(tmp_path: Path) -> Path:
     """Create a temp dir for init scripts."""
     init_dir = tmp_path / "init.d"
@@ -48,12 +64,31 @@ def tmp_init_dir(tmp_path: Path) -> Path:
     return init_dir
 
 
-@pytest.fixture
+def _write_executable(path: Path, contents: str) -> None:
+    """Create an executable script, setting the mode at open() time.
+
+    A trailing chmod still runs in case the umask stripped the x bits,
+    but the common case is a single open syscall instead of
+    write_text + chmod per script.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o755)
+    try:
+        os.write(fd, contents.encode())
+    finally:
+        os.close(fd)
+    if path.stat().st_mode & 0o111 != 0o111:
+        path.chmod(0o755)
+
+
+@pytest.fixture(scope="session")
 def init_script(tmp_init_dir: Path) -> Path:
-    """Create a simple init script."""
+    """Create a simple init script once per session.
+
+    Consumers only mount or read it — nothing mutates the file, so
+    per-test recreation was pure syscall overhead.
+    """
     script = tmp_init_dir / "setup.sh"
-    script.write_text("#!/bin/sh\necho 'INIT OK' > /init-ok.txt\n")
-    script.chmod(0o755)
+    _write_executable(script, "#!/bin/sh\necho 'INIT OK' > /init-ok.txt\n")
     return script
 
 
@@ -61,8 +96,7 @@ def init_script(tmp_init_dir: Path) -> Path:
 def bad_script(tmp_init_dir: Path) -> Path:
     """Create a failing init script."""
     script = tmp_init_dir / "fail.sh"
-    script.write_text("#!/bin/sh\necho 'FAIL' >&2\nexit 1\n")
-    script.chmod(0o755)
+    _write_executable(script, "#!/bin/sh\necho 'FAIL' >&2\nexit 1\n")
     return script
 
 
@@ -77,7 +111,20 @@ def data_file(tmp_path: Path) -> Path:
 @pytest.fixture(autouse=True, scope="session")
 def cleanup_stale_containers(podman_exe: str) -> Generator[None, None, None]:
     yield
-    # After all tests
+    # After all tests: ask the API over the UDS whether anything leaked
+    # before paying a podman fork for the removal.
+    socket_path = get_podman_socket()
+    if socket_path is not None:
+        filters = quote(json.dumps({"name": [f"^{TEST_CONTAINER_PREFIX}"]}))
+        try:
+            body = podman_rest_get(
+                f"/v4.0.0/libpod/containers/json?all=true&filters={filters}",
+                socket_path,
+            )
+            if not json.loads(body):
+                return  # Nothing stale — skip the fork entirely
+        except (OSError, RuntimeError, ValueError):
+            pass  # API unavailable — fall through to the CLI
     subprocess.run(  # noqa: S603
         [podman_exe, "rm", "-f", "--filter", f"name=^{TEST_CONTAINER_PREFIX}"],
         check=False,
@@ -1,4 +1,5 @@
 import subprocess
+import uuid
 from collections.abc import Generator
 from functools import partial
 
@@ -7,23 +8,32 @@ import pytest
 from podman_runner import Container, ContainerConfig
 
 
-@pytest.fixture(scope="class")
-def podman_container(
-    container_prefix: str, request: pytest.FixtureRequest
-) -> Generator[Container, None, None]:
-    """One container per test class, unique across workers."""
-    # Use class name + random suffix
-    class_name = request.cls.__name__.lower().replace("test", "")
-    unique_id = __import__("uuid").uuid4().hex[:8]
-
-    name = f"{container_prefix}-{class_name}-{unique_id}"
-
-    config = ContainerConfig(
-        name=name,
+def _alpine_config(container_prefix: str, suffix: str) -> ContainerConfig:
+    unique_id = uuid.uuid4().hex[:8]
+    return ContainerConfig(
+        name=f"{container_prefix}-{suffix}-{unique_id}",
         image="docker.io/library/alpine",
         command=["sleep", "infinity"],
     )
-    container = Container(config)
+
+
+@pytest.fixture(scope="session")
+def podman_container(container_prefix: str) -> Generator[Container, None, None]:
+    """One shared container for the whole session.
+
+    Image pull and container create dominate integration-test cost, so
+    tests that only exec/inspect share this instance and must leave its
+    lifecycle alone — use ``throwaway_container`` to start/stop.
+    """
+    container = Container(_alpine_config(container_prefix, "shared"))
+    with container:
+        yield container
+
+
+@pytest.fixture
+def throwaway_container(container_prefix: str) -> Generator[Container, None, None]:
+    """A private container for tests that mutate lifecycle state."""
+    container = Container(_alpine_config(container_prefix, "throwaway"))
     with container:
         yield container
 
@@ -47,20 +57,20 @@ class TestAlpineContainerBasics:
 
 
 class TestDoubleStart:
-    def test_container_double_start(self, podman_container: Container) -> None:
+    def test_container_double_start(self, throwaway_container: Container) -> None:
         """Test that calling start again creates a new container instance."""
-        assert podman_container.container_id is not None
-        first_id = podman_container.container_id
-        podman_container.start()  # should stop old one
-        assert podman_container.container_id is not None
-        assert podman_container.container_id != first_id
+        assert throwaway_container.container_id is not None
+        first_id = throwaway_container.container_id
+        throwaway_container.start()  # should stop old one
+        assert throwaway_container.container_id is not None
+        assert throwaway_container.container_id != first_id
 
 
 class TestLifecycle:
-    def test_container_stop(self, podman_container: Container, podman_exe: str) -> None:
+    def test_container_stop(self, throwaway_container: Container, podman_exe: str) -> None:
         """Test that stopping the container removes it from podman ps --all."""
-        assert podman_container.container_id is not None
-        c_id: str = podman_container.container_id
+        assert throwaway_container.container_id is not None
+        c_id: str = throwaway_container.container_id
 
         check = partial(
             subprocess.run,
@@ -73,7 +83,7 @@ class TestLifecycle:
         result_1 = check()
         assert result_1.stdout.strip() != ""
 
-        podman_container.stop()  # should stop old one
+        throwaway_container.stop()  # should stop old one
 
         result_2 = check()
         assert result_2.stdout.strip() == ""
@@ -1,28 +1,19 @@
 # tests/integration/test_examples_run_successfully.py
 from __future__ import annotations
 
+import runpy
 import subprocess
 from pathlib import Path
 
 import pytest
 
-
 # ------------------------------------------------------------------ #
 # Find repo root path
 # ------------------------------------------------------------------ #
-def git_repo_root() -> Path:
-    try:
-        root = subprocess.check_output(
-            ["git", "rev-parse", "--show-toplevel"],  # noqa: S607
-            cwd=Path(__file__).parent,
-            text=True,
-        ).strip()
-        return Path(root)
-    except subprocess.CalledProcessError as e:
-        pytest.fail(f"Could not find git root: {e}")
-
-
-REPO_ROOT = git_repo_root()
+# __file__ already anchors the repo; forking git at collection time to
+# ask the same question costs ~30-80ms on every discovery.
+REPO_ROOT = Path(__file__).resolve().parents[2]
+assert (REPO_ROOT / "pyproject.toml").is_file(), f"Not a repo root: {REPO_ROOT}"
 EXAMPLES_DIR = REPO_ROOT / "examples"
 
 
@@ -48,17 +39,13 @@ def _example_files() -> list[Path]:
     return files
 
 
-# ------------------------------------------------------------------ #
-# Test each example
-# ------------------------------------------------------------------ #
-@pytest.mark.parametrize(
-    "example_file",
-    _example_files(),
-    ids=lambda p: p.name,
-)
-def test_example_runs_successfully(example_file: Path) -> None:
-    print(f"\n=== Running example: {example_file.name} ===")
+# Scanned exactly once at collection; parametrize reads this list so a
+# future refactor cannot accidentally re-glob per test.
+_EXAMPLE_FILES = _example_files()
+
 
+def _run_example_subprocess(example_file: Path) -> None:
+    """Isolation-debugging path: one fresh interpreter per example via uv."""
     result = subprocess.run(  # noqa: S603
         ["uv", "run", str(example_file)],  # noqa: S607
         cwd=REPO_ROOT,
@@ -78,4 +65,35 @@ def test_example_runs_successfully(example_file: Path) -> None:
         f"STDOUT:\n{result.stdout.rstrip() or '(empty)'}"
     )
 
+
+# ------------------------------------------------------------------ #
+# Test each example
+# ------------------------------------------------------------------ #
+@pytest.mark.parametrize(
+    "example_file",
+    _EXAMPLE_FILES,
+    ids=lambda p: p.name,
+)
+def test_example_runs_successfully(
+    example_file: Path, request: pytest.FixtureRequest, capfd: pytest.CaptureFixture[str]
+) -> None:
+    print(f"\n=== Running example: {example_file.name} ===")
+
+    if request.config.getoption("--examples-subprocess"):
+        _run_example_subprocess(example_file)
+        return
+
+    # Default path: execute in-process so interpreter startup, uv
+    # resolution and podman_runner imports are paid once per session,
+    # not once per example.
+    try:
+        runpy.run_path(str(example_file), run_name="__main__")
+    except SystemExit as e:
+        out, err = capfd.readouterr()
+        assert e.code in (0, None), (
+            f"Example {example_file.name} failed (exit {e.code})\n"
+            f"STDERR:\n{err.rstrip() or '(empty)'}\n"
+            f"STDOUT:\n{out.rstrip() or '(empty)'}"
+        )
+
     print(f"✓ {example_file.name} ran successfully (all containers used safe prefixed names)")
@@ -0,0 +1,26 @@
+# tests/unit/conftest.py
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Generator
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _no_real_subprocess() -> Generator[None, None, None]:
+    """Refuse real process spawns for the whole unit-test session.
+
+    A test that forgets to stub subprocess would otherwise fork a real
+    podman — seconds of latency and a host dependency. Guarding Popen
+    covers run/check_output too, while per-test patches (mocker, fp)
+    install on top of it and win.
+    """
+    mp = pytest.MonkeyPatch()
+
+    def _boom(*args: object, **kwargs: object) -> None:
+        raise RuntimeError(f"Unit test spawned a real process: {args!r}")
+
+    mp.setattr(subprocess, "Popen", _boom)
+    yield
+    mp.undo()
@@ -1,20 +1,24 @@
-# tests/unit/test_core_mocked.py
+# tests/unit/test_core.py
 from __future__ import annotations
 
+import dataclasses
 import subprocess
-from collections.abc import Generator
+from collections.abc import Callable
 from pathlib import Path
+from types import SimpleNamespace
 from typing import cast
-from unittest.mock import MagicMock, patch
 
 import pytest
+from pytest_mock import MockerFixture
+from pytest_subprocess import FakeProcess
 
 from podman_runner import Container, ContainerConfig
+from podman_runner.core import _Port_Binding
 
 
-@pytest.fixture
-def config(container_prefix: str) -> ContainerConfig:
-    """Generate a container configuration."""
+@pytest.fixture(scope="session")
+def _base_config_template(container_prefix: str) -> ContainerConfig:
+    """Build the shared config prototype once per session."""
     return ContainerConfig(
         name=container_prefix + "unit",
         image="alpine:latest",
@@ -22,11 +26,20 @@ def config(container_prefix: str) -> ContainerConfig:
     )
 
 
-@pytest.fixture(autouse=True)
-def mock_preflight() -> Generator[None, None, None]:
-    """Mock preflight checks for all unit tests."""
-    with patch("podman_runner.core.run_preflight_checks"):
-        yield
+@pytest.fixture
+def config(_base_config_template: ContainerConfig) -> ContainerConfig:
+    """Per-test copy of the prototype; tests mutate fields freely."""
+    return dataclasses.replace(_base_config_template)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def mock_preflight(module_mocker: MockerFixture) -> None:
+    """Mock preflight checks once for the whole module.
+
+    No test asserts on the call args, so one install/uninstall pair
+    replaces a per-test patch cycle.
+    """
+    module_mocker.patch("podman_runner.core.run_preflight_checks")
 
 
 # --------------------------------------------------------------------- #
@@ -51,20 +64,21 @@ def test_get_env_no_podman_host(config: ContainerConfig) -> None:
 # --------------------------------------------------------------------- #
 # Tests for Port Handling
 # --------------------------------------------------------------------- #
-def test_inspect_port_mappings_basic(config: ContainerConfig) -> None:
+def test_inspect_port_mappings_basic(config: ContainerConfig, mocker: MockerFixture) -> None:
     """Test inspect_port_mappings with no ports."""
     c = Container(config)
     c.container_id = "test_id"
-    with patch("subprocess.check_output", return_value="null") as co_mock:
-        ports = c.inspect_port_mappings()
+    proc = subprocess.CompletedProcess([], 0, stdout="null")
+    sc_mock = mocker.patch("podman_runner.core.spawn_capture", return_value=proc)
+    ports = c.inspect_port_mappings()
     assert ports == {}
     # Test caching
-    with patch("subprocess.check_output", side_effect=Exception("should not call")):
-        assert c.inspect_port_mappings() == {}
-    co_mock.assert_called_once()
+    mocker.patch("podman_runner.core.spawn_capture", side_effect=Exception("should not call"))
+    assert c.inspect_port_mappings() == {}
+    sc_mock.assert_called_once()
 
 
-def test_inspect_port_mappings_with_ports(config: ContainerConfig) -> None:
+def test_inspect_port_mappings_with_ports(config: ContainerConfig, mocker: MockerFixture) -> None:
     """Test inspect_port_mappings with actual ports."""
     c = Container(config)
     c.container_id = "test_id"
@@ -72,8 +86,9 @@ def test_inspect_port_mappings_with_ports(config: ContainerConfig) -> None:
         '{"80/tcp": [{"HostIp": "0.0.0.0", "HostPort": "8080"}], '
         '"443/tcp": [{"HostIp": "0.0.0.0", "HostPort": "8443"}]}'
     )
-    with patch("subprocess.check_output", return_value=mock_output):
-        ports = cast(dict[int, list[dict[str, str]]], c.inspect_port_mappings())
+    proc = subprocess.CompletedProcess([], 0, stdout=mock_output)
+    mocker.patch("podman_runner.core.spawn_capture", return_value=proc)
+    ports = cast(dict[int, list[dict[str, str]]], c.inspect_port_mappings())
     assert 80 in ports
     assert 443 in ports
     assert ports[80][0]["HostPort"] == "8080"
@@ -87,168 +102,184 @@ def test_inspect_port_mappings_no_container_id(config: ContainerConfig) -> None:
         c.inspect_port_mappings()
 
 
-def test_get_port_found(config: ContainerConfig) -> None:
-    """Test get_port when port is found."""
-    c = Container(config)
-    c._ports = {80: [{"HostPort": "8080", "HostIp": ""}]}
-    port = c.get_port(80)
-    assert port == 8080
-
-
-def test_get_port_not_found(config: ContainerConfig) -> None:
-    """Test get_port when port not in mappings."""
-    c = Container(config)
-    c._ports = {}
-    assert c.get_port(80) is None
-
-
-def test_get_port_empty_bindings(config: ContainerConfig) -> None:
-    """Test get_port when bindings list is empty."""
+@pytest.mark.parametrize(
+    ("ports", "query", "expected"),
+    [
+        pytest.param({80: [{"HostPort": "8080", "HostIp": ""}]}, 80, 8080, id="found"),
+        pytest.param({}, 80, None, id="not-found"),
+        pytest.param({80: []}, 80, None, id="empty-bindings"),
+    ],
+)
+def test_get_port(
+    config: ContainerConfig,
+    ports: dict[int, list[_Port_Binding]],
+    query: int,
+    expected: int | None,
+) -> None:
+    """Table-driven get_port lookups against a pre-seeded port cache."""
     c = Container(config)
-    c._ports = {80: []}
-    assert c.get_port(80) is None
+    c._ports = ports
+    assert c.get_port(query) == expected
 
 
 # --------------------------------------------------------------------- #
 # Tests for Command Building
 # --------------------------------------------------------------------- #
-def test_build_run_cmd_no_options(container_prefix: str, config: ContainerConfig) -> None:
-    c = Container(config)
-    with patch.object(c, "_get_podman", return_value="podman"):
-        cmd = c._build_run_cmd()
-    expected = [
-        "podman",
-        "run",
-        "-d",
-        "--name",
-        (container_prefix + "unit"),
-        "alpine:latest",
-        "sleep",
-        "10",
-    ]
-    assert cmd == expected
-
-
-def test_build_run_cmd_with_env(config: ContainerConfig) -> None:
-    config.env = {"MY_VAR": "value1"}
-    c = Container(config)
-    with patch.object(c, "_get_podman", return_value="podman"):
-        cmd = c._build_run_cmd()
-    assert "-e" in cmd
-    assert "MY_VAR=value1" in cmd
-
-
-def test_build_run_cmd_with_multiple_env(config: ContainerConfig) -> None:
-    config.env = {"VAR1": "val1", "VAR2": "val2"}
+_BUILD_RUN_CMD_CASES = [
+    pytest.param(
+        lambda cfg: None,
+        lambda cmd, cfg: cmd
+        == [
+            "podman",
+            "run",
+            "-d",
+            "--replace",
+            "--name",
+            cfg.name,
+            "alpine:latest",
+            "sleep",
+            "10",
+        ],
+        id="no-options",
+    ),
+    pytest.param(
+        lambda cfg: setattr(cfg, "env", {"MY_VAR": "value1"}),
+        lambda cmd, cfg: "-e" in cmd and "MY_VAR=value1" in cmd,
+        id="env",
+    ),
+    pytest.param(
+        lambda cfg: setattr(cfg, "env", {"VAR1": "val1", "VAR2": "val2"}),
+        lambda cmd, cfg: cmd.count("-e") == 2 and "VAR1=val1" in cmd and "VAR2=val2" in cmd,
+        id="multiple-env",
+    ),
+    pytest.param(
+        lambda cfg: setattr(cfg, "volumes", {Path("/host/path"): "/container/path"}),
+        lambda cmd, cfg: "-v" in cmd and f"{Path('/host/path')}:/container/path" in cmd,
+        id="volumes",
+    ),
+    pytest.param(
+        lambda cfg: setattr(cfg, "health_cmd", ["pg_isready", "-U", "postgres"]),
+        lambda cmd, cfg: "--health-cmd" in cmd
+        and "pg_isready -U postgres" in cmd
+        and "--health-interval=1.0s" in cmd
+        and "--health-retries=30" in cmd
+        and "--health-start-period=30s" in cmd,
+        id="health-cmd",
+    ),
+    pytest.param(
+        lambda cfg: setattr(cfg, "ports", {80: 8080, 443: None}),
+        lambda cmd, cfg: cmd.count("-p") == 2 and "8080:80" in cmd and ":443" in cmd,
+        id="ports",
+    ),
+]
+
+
+@pytest.mark.parametrize(("mutate", "check"), _BUILD_RUN_CMD_CASES)
+def test_build_run_cmd(
+    config: ContainerConfig,
+    mutate: Callable[[ContainerConfig], None],
+    check: Callable[[list[str], ContainerConfig], bool],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """One Container construction and _get_podman patch per argv variant."""
+    mutate(config)
     c = Container(config)
-    with patch.object(c, "_get_podman", return_value="podman"):
-        cmd = c._build_run_cmd()
-    assert cmd.count("-e") == 2
-    assert "VAR1=val1" in cmd
-    assert "VAR2=val2" in cmd
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    cmd = c._build_run_cmd()
+    assert check(cmd, config)
 
 
 def test_build_run_cmd_with_init_scripts(
-    config: ContainerConfig,
-    tmp_init_dir: Path,
-    init_script: Path,
+    config: ContainerConfig, tmp_init_dir: Path, init_script: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     config.init_dir = "/init.d"
     config.init_scripts = [init_script]
     c = Container(config)
-    with patch.object(c, "_get_podman", return_value="podman"):
-        cmd = c._build_run_cmd()
-    assert f"-v {init_script}:/init.d/00-setup.sh:ro" in " ".join(cmd)
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    cmd = c._build_run_cmd()
+    assert f"{init_script}:/init.d/00-setup.sh:ro" in cmd
 
 
 def test_build_run_cmd_missing_init_script(
-    config: ContainerConfig,
-    tmp_init_dir: Path,
+    config: ContainerConfig, tmp_init_dir: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     config.init_dir = "/init.d"
     config.init_scripts = [Path("/nonexistent.sh")]
     c = Container(config)
-    with patch.object(c, "_get_podman", return_value="podman"):
-        with pytest.raises(FileNotFoundError):
-            c._build_run_cmd()
-
-
-def test_build_run_cmd_with_volumes(config: ContainerConfig) -> None:
-    config.volumes = {Path("/host/path"): "/container/path"}
-    c = Container(config)
-    with patch.object(c, "_get_podman", return_value="podman"):
-        cmd = c._build_run_cmd()
-    assert "-v" in cmd
-    assert f"{Path('/host/path')}:/container/path" in " ".join(cmd)
-
-
-def test_build_run_cmd_with_ports(config: ContainerConfig) -> None:
-    """Test _build_run_cmd with ports configuration."""
-    config.ports = {80: 8080, 443: None}
-    c = Container(config)
-    with patch.object(c, "_get_podman", return_value="podman"):
-        cmd = c._build_run_cmd()
-    assert "-p" in cmd
-    assert cmd.count("-p") == 2
-    cmd_str = " ".join(cmd)
-    assert "8080:80" in cmd_str
-    assert ":443" in cmd_str
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    with pytest.raises(FileNotFoundError):
+        c._build_run_cmd()
 
 
 # --------------------------------------------------------------------- #
 # Tests for Lifecycle
 # --------------------------------------------------------------------- #
-def test_start_successful_execution(config: ContainerConfig) -> None:
+def test_start_successful_execution(
+    config: ContainerConfig, mocker: MockerFixture, fp: FakeProcess, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test that the successful path in start() is covered, including setting container_id."""
     c = Container(config)
-    result_mock = subprocess.CompletedProcess(
-        ["podman", "run"], 0, stdout="success-123\n", stderr=""
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    mocker.patch.object(c, "_build_run_cmd", return_value=["podman", "run", "..."])
+    mocker.patch.object(c, "_wait_for_ready")
+    fp.register(["podman", "run", "..."], stdout="success-123\n")
+    result = c.start()
+    assert result is c
+    assert c.container_id == "success-123"
+    assert fp.call_count(["podman", "run", "..."]) == 1
+
+
+def test_start_warms_port_cache(
+    config: ContainerConfig, mocker: MockerFixture, fp: FakeProcess, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that start() pre-populates _ports when ports are configured."""
+    config.ports = {80: None}
+    c = Container(config)
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    mocker.patch.object(c, "_build_run_cmd", return_value=["podman", "run", "..."])
+    mocker.patch.object(c, "_wait_for_ready")
+    fp.register(["podman", "run", "..."], stdout="success-123\n")
+    sc_mock = mocker.patch(
+        "podman_runner.core.spawn_capture",
+        return_value=subprocess.CompletedProcess(
+            [], 0, stdout='{"80/tcp": [{"HostIp": "0.0.0.0", "HostPort": "8080"}]}'
+        ),
     )
-    with (
-        patch.object(c, "_get_podman", return_value="podman"),
-        patch.object(c, "_build_run_cmd", return_value=["podman", "run", "..."]),
-        patch.object(c, "_wait_for_ready"),
-        patch("subprocess.run", return_value=result_mock) as run_mock,
-    ):
-        result = c.start()
-        assert result is c
-        assert c.container_id == "success-123"
-        run_mock.assert_called_once()
+    c.start()
+    sc_mock.assert_called_once()
+    mocker.patch("podman_runner.core.spawn_capture", side_effect=Exception("should not call"))
+    assert c.get_port(80) == 8080
 
 
-def test_start_fails_no_id(config: ContainerConfig) -> None:
+def test_start_fails_no_id(config: ContainerConfig, mocker: MockerFixture, fp: FakeProcess) -> None:
     c = Container(config)
-    with (
-        patch.object(c, "_build_run_cmd", return_value=["podman", "run"]),
-        patch("subprocess.run", return_value=subprocess.CompletedProcess([], 0, stdout="\n")),
-    ):
-        with pytest.raises(RuntimeError, match="no ID returned"):
-            c.start()
+    mocker.patch.object(c, "_build_run_cmd", return_value=["podman", "run"])
+    fp.register(["podman", "run"], stdout="\n")
+    with pytest.raises(RuntimeError, match="no ID returned"):
+        c.start()
 
 
-def test_start_subprocess_error(config: ContainerConfig) -> None:
+def test_start_subprocess_error(
+    config: ContainerConfig, mocker: MockerFixture, fp: FakeProcess
+) -> None:
     c = Container(config)
-    err = subprocess.CalledProcessError(1, ["podman"], stderr="boom")
-    with (
-        patch.object(c, "_build_run_cmd", return_value=["podman", "run"]),
-        patch("subprocess.run", side_effect=err),
-    ):
-        with pytest.raises(RuntimeError, match="Failed to start container"):
-            c.start()
+    mocker.patch.object(c, "_build_run_cmd", return_value=["podman", "run"])
+    fp.register(["podman", "run"], returncode=1, stderr="boom")
+    with pytest.raises(RuntimeError, match="Failed to start container"):
+        c.start()
 
 
-def test_check_status_running(config: ContainerConfig) -> None:
+def test_check_status_running(config: ContainerConfig, mocker: MockerFixture) -> None:
     c = Container(config)
     c.container_id = "abc123"
-    mock = MagicMock(stdout="running")
-    with patch("subprocess.run", return_value=mock):
-        assert c.check_status() == "running"
+    mocker.patch("podman_runner.core.spawn_capture", return_value=SimpleNamespace(stdout="running"))
+    assert c.check_status() == "running"
 
 
-def test_check_status_not_running(config: ContainerConfig) -> None:
+def test_check_status_not_running(config: ContainerConfig, mocker: MockerFixture) -> None:
     c = Container(config)
-    with patch("subprocess.run", return_value=MagicMock(stdout="")):
-        assert c.check_status() == "Not running"
+    mocker.patch("podman_runner.core.spawn_capture", return_value=SimpleNamespace(stdout=""))
+    assert c.check_status() == "Not running"
 
 
 def test_check_status_no_container_id(config: ContainerConfig) -> None:
@@ -257,16 +288,100 @@ def test_check_status_no_container_id(config: ContainerConfig) -> None:
     assert c.check_status() == "Not running"
 
 
-def test_check_status_execution(config: ContainerConfig) -> None:
-    """Test that check_status actually executes its return statement."""
+def test_is_running_true(
+    config: ContainerConfig, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test is_running when podman ps reports the container."""
+    c = Container(config)
+    c.container_id = "abc123"
+    proc = subprocess.CompletedProcess([], 0, stdout="abc123\n")
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    sc_mock = mocker.patch("podman_runner.core.spawn_capture", return_value=proc)
+    assert c.is_running() is True
+    sc_mock.assert_called_once_with(
+        ["podman", "ps", "--filter", "id=abc123", "--filter", "status=running", "-q"],
+        env=None,
+    )
+
+
+def test_is_running_false_when_not_started(config: ContainerConfig, mocker: MockerFixture) -> None:
+    """Test is_running without a container_id skips the subprocess."""
+    c = Container(config)
+    sc_mock = mocker.patch("podman_runner.core.spawn_capture")
+    assert c.is_running() is False
+    sc_mock.assert_not_called()
+
+
+def test_check_status_via_rest_socket(config: ContainerConfig, mocker: MockerFixture) -> None:
+    """Test check_status uses the REST socket when one is available."""
     c = Container(config)
     c.container_id = "abc123"
-    # Mock subprocess.run to return a CompletedProcess, allowing the return result.stdout to execute
-    result_mock = subprocess.CompletedProcess([], 0, stdout="running", stderr="")
-    with patch("subprocess.run", return_value=result_mock) as run_mock:
-        result = c.check_status()
-    assert result == "running"
-    run_mock.assert_called_once()
+    mocker.patch("podman_runner.core.PODMAN_SOCKET", "/run/user/1000/podman/podman.sock")
+    rest_mock = mocker.patch(
+        "podman_runner.core.podman_rest_get",
+        return_value=b'{"State": {"Status": "running"}}',
+    )
+    sc_mock = mocker.patch("podman_runner.core.spawn_capture")
+    assert c.check_status() == "running"
+    rest_mock.assert_called_once_with(
+        "/v4.0.0/libpod/containers/abc123/json", "/run/user/1000/podman/podman.sock"
+    )
+    sc_mock.assert_not_called()
+
+
+def test_rest_get_skipped_without_socket(config: ContainerConfig, mocker: MockerFixture) -> None:
+    """Test _rest_get returns None when no local socket exists."""
+    c = Container(config)
+    mocker.patch("podman_runner.core.PODMAN_SOCKET", None)
+    assert c._rest_get("/v4.0.0/libpod/containers/x/json") is None
+
+
+def test_rest_get_skipped_for_remote_host(config: ContainerConfig, mocker: MockerFixture) -> None:
+    """Test _rest_get is bypassed when podman_host targets a remote."""
+    config.podman_host = "ssh://remote"
+    c = Container(config)
+    mocker.patch("podman_runner.core.PODMAN_SOCKET", "/run/user/1000/podman/podman.sock")
+    assert c._rest_get("/v4.0.0/libpod/containers/x/json") is None
+
+
+def test_rest_get_falls_back_on_http_error(config: ContainerConfig, mocker: MockerFixture) -> None:
+    """Test _rest_get returns None when the API answers non-2xx."""
+    c = Container(config)
+    mocker.patch("podman_runner.core.PODMAN_SOCKET", "/run/user/1000/podman/podman.sock")
+    mocker.patch(
+        "podman_runner.core.podman_rest_get", side_effect=RuntimeError("GET /x failed: 404")
+    )
+    assert c._rest_get("/v4.0.0/libpod/containers/x/json") is None
+
+
+def test_bulk_refresh_populates_caches(config: ContainerConfig, mocker: MockerFixture) -> None:
+    """Test that one inspect call refreshes several containers."""
+    c1 = Container(config)
+    c1.container_id = "id-one"
+    c2 = Container(config)
+    c2.container_id = "id-two"
+    mock_output = (
+        '[{"Id": "id-one", '
+        '"NetworkSettings": {"Ports": {"80/tcp": [{"HostIp": "0.0.0.0", "HostPort": "8080"}]}}, '
+        '"State": {"Status": "running"}}, '
+        '{"Id": "id-two", '
+        '"NetworkSettings": {"Ports": null}, '
+        '"State": {"Status": "exited"}}]'
+    )
+    co_mock = mocker.patch("subprocess.check_output", return_value=mock_output)
+    Container._bulk_refresh([c1, c2])
+    co_mock.assert_called_once()
+    assert c1.get_port(80) == 8080
+    assert c1.check_status() == "running"
+    assert c2.check_status() == "exited"
+
+
+def test_bulk_refresh_no_started_containers(config: ContainerConfig, mocker: MockerFixture) -> None:
+    """Test that _bulk_refresh skips the subprocess when nothing is started."""
+    c = Container(config)
+    co_mock = mocker.patch("subprocess.check_output")
+    Container._bulk_refresh([c])
+    co_mock.assert_not_called()
 
 
 def test_wait_for_ready_skipped_when_no_health_cmd(config: ContainerConfig) -> None:
@@ -276,66 +391,121 @@ def test_wait_for_ready_skipped_when_no_health_cmd(config: ContainerConfig) -> N
     c._wait_for_ready()  # no subprocess call
 
 
-def test_wait_for_ready_success_first_try(config: ContainerConfig) -> None:
+def test_wait_for_ready_success(
+    config: ContainerConfig, fp: FakeProcess, monkeypatch: pytest.MonkeyPatch
+) -> None:
     c = Container(config)
     c.container_id = "abc123"
     c.config.health_cmd = ["true"]
-    mock = MagicMock(return_value=subprocess.CompletedProcess([], 0))
-    with patch("subprocess.run", mock), patch("time.time", side_effect=[0, 1]):
-        c._wait_for_ready()
-    mock.assert_called_once()
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    wait_cmd = ["podman", "wait", "--condition=healthy", "--interval", "25ms", "abc123"]
+    fp.register(wait_cmd)
+    c._wait_for_ready()
+    assert fp.call_count(wait_cmd) == 1
+
+
+def test_wait_for_ready_falls_back_on_old_podman(
+    config: ContainerConfig, fp: FakeProcess, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Old podman rejecting --condition=healthy → the exec poll takes over."""
+    c = Container(config)
+    c.container_id = "abc123"
+    c.config.health_cmd = ["true"]
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    wait_cmd = ["podman", "wait", "--condition=healthy", "--interval", "25ms", "abc123"]
+    fp.register(wait_cmd, returncode=125, stderr=b'Error: unrecognized condition "healthy"\n')
+    exec_cmd = ["podman", "exec", "abc123", "true"]
+    fp.register(exec_cmd)
+    c._wait_for_ready()
+    assert fp.call_count(exec_cmd) == 1
 
 
-def test_wait_for_ready_timeout(config: ContainerConfig) -> None:
+def test_wait_for_ready_timeout(
+    config: ContainerConfig, mocker: MockerFixture, monkeypatch: pytest.MonkeyPatch
+) -> None:
     c = Container(config)
     c.container_id = "abc123"
     c.config.health_cmd = ["false"]
-    mock = MagicMock(return_value=subprocess.CompletedProcess([], 1))
-    time_values = [0, *list(range(1, 32))]
-    with (
-        patch("subprocess.run", mock),
-        patch("time.time", side_effect=time_values),
-        patch("time.sleep"),
-    ):
-        with pytest.raises(TimeoutError, match="did not become ready in 30s"):
-            c._wait_for_ready()
-
-
-def test_stop_no_container_id(config: ContainerConfig) -> None:
+    err = subprocess.TimeoutExpired(["podman", "wait"], 30)
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    mocker.patch("subprocess.run", side_effect=err)
+    with pytest.raises(TimeoutError, match="did not become ready in 30s"):
+        c._wait_for_ready()
+
+
+def test_stop_single_rm_call(
+    config: ContainerConfig, fp: FakeProcess, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test stop tears down with a single rm -f -t 0 invocation."""
+    c = Container(config)
+    c.container_id = "abc123"
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    rm_cmd = ["podman", "rm", "-f", "-t", "0", "abc123"]
+    fp.register(rm_cmd)
+    c.stop()
+    assert fp.call_count(rm_cmd) == 1
+    assert c.container_id is None
+
+
+def test_stop_no_container_id(config: ContainerConfig, fp: FakeProcess) -> None:
     """Test stop when no container_id."""
     c = Container(config)
-    # Should not raise or call subprocess
-    with patch("subprocess.run") as run_mock:
-        c.stop()
-    run_mock.assert_not_called()
+    # Should not raise or spawn anything (fp would reject an
+    # unregistered process)
+    c.stop()
+    assert len(fp.calls) == 0
 
 
 # --------------------------------------------------------------------- #
 # Tests for Operations
 # --------------------------------------------------------------------- #
-def test_container_logs_no_options(config: ContainerConfig) -> None:
+def test_container_logs_via_rest_socket(config: ContainerConfig, mocker: MockerFixture) -> None:
+    """Test logs() uses the REST socket when one is available."""
+    c = Container(config)
+    c.container_id = "abc123"
+    frame = b"\x01\x00\x00\x00\x00\x00\x00\x08logline\n"
+    mocker.patch("podman_runner.core.PODMAN_SOCKET", "/run/user/1000/podman/podman.sock")
+    rest_mock = mocker.patch("podman_runner.core.podman_rest_get", return_value=frame)
+    assert c.logs(tail=5) == "logline\n"
+    rest_mock.assert_called_once_with(
+        "/v4.0.0/libpod/containers/abc123/logs?stdout=true&stderr=true&tail=5",
+        "/run/user/1000/podman/podman.sock",
+    )
+
+
+def test_container_logs_no_options(
+    config: ContainerConfig, fp: FakeProcess, monkeypatch: pytest.MonkeyPatch
+) -> None:
     c = Container(config)
     c.container_id = "abc123"
-    with (
-        patch.object(c, "_get_podman", return_value="podman"),
-        patch("subprocess.check_output", return_value="logline\n") as co_mock,
-    ):
-        logs = c.logs()
-    co_mock.assert_called_once_with(["podman", "logs", "abc123"], text=True, env=None)
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    fp.register(["podman", "logs", "abc123"], stdout="logline\n")
+    logs = c.logs()
     assert logs == "logline\n"
 
 
-def test_container_logs_with_options(config: ContainerConfig) -> None:
+def test_container_logs_with_options(
+    config: ContainerConfig, fp: FakeProcess, monkeypatch: pytest.MonkeyPatch
+) -> None:
     c = Container(config)
     c.container_id = "abc123"
-    with (
-        patch.object(c, "_get_podman", return_value="podman"),
-        patch("subprocess.check_output") as co_mock,
-    ):
-        c.logs(follow=True, tail=5)
-    co_mock.assert_called_once_with(
-        ["podman", "logs", "--tail", "5", "-f", "abc123"], text=True, env=None
-    )
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    logs_cmd = ["podman", "logs", "--tail", "5", "-f", "abc123"]
+    fp.register(logs_cmd, stdout="logline\n")
+    c.logs(follow=True, tail=5)
+    assert fp.call_count(logs_cmd) == 1
+
+
+def test_container_logs_binary(
+    config: ContainerConfig, fp: FakeProcess, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test logs(binary=True) returns undecoded bytes."""
+    c = Container(config)
+    c.container_id = "abc123"
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    fp.register(["podman", "logs", "abc123"], stdout=b"logline\n")
+    logs = c.logs(binary=True)
+    assert logs == b"logline\n"
 
 
 def test_logs_raises_when_container_not_started(config: ContainerConfig) -> None:
@@ -346,32 +516,49 @@ def test_logs_raises_when_container_not_started(config: ContainerConfig) -> None
         c.logs()
 
 
-def test_container_exec_success(config: ContainerConfig) -> None:
+def test_container_exec_success(
+    config: ContainerConfig, fp: FakeProcess, monkeypatch: pytest.MonkeyPatch
+) -> None:
     c = Container(config)
     c.container_id = "abc123"
-    proc = subprocess.CompletedProcess([], 0, stdout="hello\n")
-    with (
-        patch.object(c, "_get_podman", return_value="podman"),
-        patch("subprocess.run", return_value=proc) as run_mock,
-    ):
-        result = c.exec(["echo", "hello"])
-    run_mock.assert_called_once_with(
-        ["podman", "exec", "abc123", "echo", "hello"],
-        check=True,
-        capture_output=True,
-        text=True,
-        env=None,
-    )
-    assert result == proc
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    exec_cmd = ["podman", "exec", "abc123", "echo", "hello"]
+    fp.register(exec_cmd, stdout="hello\n")
+    result = c.exec(["echo", "hello"])
+    assert fp.call_count(exec_cmd) == 1
+    assert result.returncode == 0
+    assert result.stdout == "hello\n"
 
 
-def test_container_exec_failure(config: ContainerConfig) -> None:
+def test_container_exec_failure(
+    config: ContainerConfig, fp: FakeProcess, monkeypatch: pytest.MonkeyPatch
+) -> None:
     c = Container(config)
     c.container_id = "abc123"
-    err = subprocess.CalledProcessError(1, ["podman"], output="out", stderr="err")
-    with patch("subprocess.run", side_effect=err):
-        with pytest.raises(RuntimeError, match="Command 'echo hello' failed"):
-            c.exec(["echo", "hello"])
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    fp.register(
+        ["podman", "exec", "abc123", "echo", "hello"], returncode=1, stdout="out", stderr="err"
+    )
+    with pytest.raises(RuntimeError, match="Command 'echo hello' failed"):
+        c.exec(["echo", "hello"])
+
+
+def test_injected_runner_bypasses_subprocess(
+    config: ContainerConfig, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A runner passed to the constructor replaces subprocess.run entirely."""
+    calls: list[list[str]] = []
+
+    def fake_run(cmd: list[str], **kwargs: object) -> subprocess.CompletedProcess[str]:
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, stdout="hello\n", stderr="")
+
+    c = Container(config, runner=fake_run)
+    c.container_id = "abc123"
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    result = c.exec(["echo", "hello"])
+    assert result.stdout == "hello\n"
+    assert calls == [["podman", "exec", "abc123", "echo", "hello"]]
 
 
 def test_exec_raises_when_container_not_started(config: ContainerConfig) -> None:
@@ -381,51 +568,96 @@ def test_exec_raises_when_container_not_started(config: ContainerConfig) -> None
         c.exec(["echo", "hello"])
 
 
+def test_start_many_starts_all(config: ContainerConfig, mocker: MockerFixture) -> None:
+    """Test start_many starts every container."""
+    containers = [Container(config), Container(config)]
+    s0 = mocker.patch.object(containers[0], "start", return_value=containers[0])
+    s1 = mocker.patch.object(containers[1], "start", return_value=containers[1])
+    result = Container.start_many(containers)
+    assert result == containers
+    s0.assert_called_once()
+    s1.assert_called_once()
+
+
+def test_start_many_stops_survivors_on_failure(
+    config: ContainerConfig, mocker: MockerFixture
+) -> None:
+    """Test start_many cleans up started containers when one fails."""
+    ok, bad = Container(config), Container(config)
+
+    def fake_start() -> Container:
+        ok.container_id = "abc123"
+        return ok
+
+    mocker.patch.object(ok, "start", side_effect=fake_start)
+    mocker.patch.object(bad, "start", side_effect=RuntimeError("boom"))
+    stop_mock = mocker.patch.object(ok, "stop")
+    with pytest.raises(RuntimeError, match="boom"):
+        Container.start_many([ok, bad])
+    stop_mock.assert_called_once()
+
+
 # --------------------------------------------------------------------- #
 # Tests for Context Manager
 # --------------------------------------------------------------------- #
-def test_context_manager(config: ContainerConfig) -> None:
+@pytest.mark.parametrize("mock_level", ["full", "partial"])
+def test_context_manager(
+    config: ContainerConfig,
+    mocker: MockerFixture,
+    fp: FakeProcess,
+    mock_level: str,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Enter/exit drives start/stop; 'partial' lets the real bodies run."""
     c = Container(config)
-    with (
-        patch.object(c, "start", return_value=c) as start_mock,
-        patch.object(c, "stop") as stop_mock,
-    ):
+    if mock_level == "full":
+        start_mock = mocker.patch.object(c, "start", return_value=c)
+        stop_mock = mocker.patch.object(c, "stop")
         with c:
             pass
-    start_mock.assert_called_once()
-    stop_mock.assert_called_once()
+        start_mock.assert_called_once()
+        stop_mock.assert_called_once()
+        return
 
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    mocker.patch.object(c, "_build_run_cmd", return_value=["podman", "run", "..."])
+    mocker.patch.object(c, "_wait_for_ready")
+    fp.register(["podman", "run", "..."], stdout="abc123\n")  # Start container
+    fp.register(["podman", "rm", "-f", "-t", "0", "abc123"])  # Remove container
 
-def test_context_manager_execution(config: ContainerConfig) -> None:
-    """Test context manager with partial mocking to allow __exit__ execution."""
-    c = Container(config)
-    with (
-        patch.object(c, "_get_podman", return_value="podman"),
-        patch.object(c, "_build_run_cmd", return_value=["podman", "run", "..."]),
-        patch.object(c, "_wait_for_ready"),
-        patch("subprocess.run") as run_mock,
-    ):
-        # Mock the start process and configure side effects
-        run_mock.side_effect = [
-            subprocess.CompletedProcess([], 0, stdout="abc123\n"),  # Start container
-            None,  # Stop container
-            None,  # Remove container
-        ]
+    # This should actually call __enter__ and __exit__
+    with c as container:
+        assert container is c
+        assert c.container_id == "abc123"
 
-        # This should actually call __enter__ and __exit__
-        with c as container:
-            assert container is c
-            assert c.container_id == "abc123"
+    assert c.container_id is None
 
-        assert c.container_id is None
+
+def test_finalizer_removes_leaked_container(
+    config: ContainerConfig, mocker: MockerFixture, fp: FakeProcess
+) -> None:
+    """Test the finalizer tears down a container that was never stopped."""
+    c = Container(config)
+    c.container_id = "abc123"
+    mocker.patch("podman_runner.core.get_podman_exe", return_value="podman")
+    rm_cmd = ["podman", "rm", "-f", "-t", "0", "abc123"]
+    fp.register(rm_cmd)
+    c._finalizer()
+    assert fp.call_count(rm_cmd) == 1
 
 
-def test_del_stops_container(config: ContainerConfig) -> None:
+def test_finalizer_noop_after_stop(
+    config: ContainerConfig, fp: FakeProcess, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test the finalizer does nothing once stop() already ran."""
     c = Container(config)
     c.container_id = "abc123"
-    with patch.object(c, "stop") as stop_mock:
-        c.__del__()
-    stop_mock.assert_called_once()
+    monkeypatch.setattr(c, "_get_podman", lambda: "podman")
+    rm_cmd = ["podman", "rm", "-f", "-t", "0", "abc123"]
+    fp.register(rm_cmd)
+    c.stop()
+    c._finalizer()
+    assert fp.call_count(rm_cmd) == 1
 
 
 # --------------------------------------------------------------------- #
@@ -440,12 +672,3 @@ def test_repr_running(config: ContainerConfig) -> None:
 def test_repr_stopped(config: ContainerConfig) -> None:
     c = Container(config)
     assert repr(c) == f"<Container {c.config.name} [stopped] id=None>"
-
-
-def test_repr_execution_running(config: ContainerConfig) -> None:
-    """Ensure __repr__ return statement executes when running."""
-    c = Container(config)
-    c.container_id = "test-123"
-    result = repr(c)  # This should execute the return statement
-    assert "[running]" in result and "id=test-123" in result
-    assert result.startswith("<Container ") and result.endswith(">")
@@ -1,60 +1,112 @@
-# tests/unit/test_helpers_mocked.py
+# tests/unit/test_helpers.py
 from __future__ import annotations
 
-from unittest.mock import patch
+import subprocess
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from podman_runner.helpers import (
+    demux_log_stream,
+    get_podman_exe,
+    get_podman_socket,
+    spawn_capture,
+    tmp_path_factory_safe,
+)
 
-def test_get_podman_exe_found() -> None:
-    """Test when podman is in PATH."""
-    with patch("shutil.which", return_value="/usr/bin/podman"):
-        from podman_runner.helpers import get_podman_exe
 
-        assert get_podman_exe() == "/usr/bin/podman"
+def test_get_podman_exe_found(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test when podman was resolved at import."""
+    monkeypatch.setattr("podman_runner.helpers.PODMAN_EXE", "/usr/bin/podman")
+    assert get_podman_exe() == "/usr/bin/podman"
 
 
-def test_get_podman_exe_not_found() -> None:
+def test_get_podman_exe_not_found(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test when podman is NOT in PATH."""
+    monkeypatch.setattr("podman_runner.helpers.PODMAN_EXE", None)
     with patch("shutil.which", return_value=None):
-        from podman_runner.helpers import get_podman_exe
-
         with pytest.raises(RuntimeError, match="podman not found in PATH"):
             get_podman_exe()
 
 
-def test_tmp_path_factory_safe_success() -> None:
+def test_get_podman_socket_absent(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test when no podman socket exists."""
+    monkeypatch.setenv("XDG_RUNTIME_DIR", "/nonexistent")
+    assert get_podman_socket() is None
+
+
+def test_get_podman_socket_found(monkeypatch: pytest.MonkeyPatch, tmp_path: object) -> None:
+    """Test when the podman socket path exists."""
+    runtime_dir = Path(str(tmp_path))
+    (runtime_dir / "podman").mkdir(exist_ok=True)
+    (runtime_dir / "podman" / "podman.sock").touch()
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(runtime_dir))
+    assert get_podman_socket() == str(runtime_dir / "podman" / "podman.sock")
+
+
+def test_spawn_capture_success() -> None:
+    """Test spawn_capture runs a command and captures stdout."""
+    result = spawn_capture(["echo", "hello"])
+    assert result.returncode == 0
+    assert result.stdout == "hello\n"
+
+
+def test_spawn_capture_check_raises() -> None:
+    """Test spawn_capture with check=True raises on nonzero exit."""
+    with pytest.raises(subprocess.CalledProcessError):
+        spawn_capture(["sh", "-c", "echo boom >&2; exit 3"], check=True)
+
+
+def test_demux_log_stream_frames() -> None:
+    """Test that multiplexed frames are stripped down to their payloads."""
+    payload = b"\x01\x00\x00\x00\x00\x00\x00\x04out\n" + b"\x02\x00\x00\x00\x00\x00\x00\x04err\n"
+    assert demux_log_stream(payload) == b"out\nerr\n"
+
+
+def test_demux_log_stream_raw_passthrough() -> None:
+    """Test that a raw (tty) stream is returned unchanged."""
+    assert demux_log_stream(b"plain output\n") == b"plain output\n"
+
+
+def test_tmp_path_factory_safe_success(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test tmp_path_factory_safe normal operation."""
-    with patch("tempfile.mkdtemp", return_value="/mock/tmp_dir"):
-        with patch("pathlib.Path.is_dir", return_value=True):
-            with patch("pathlib.Path.exists", return_value=True):
-                with patch("shutil.rmtree") as rmtree_mock:
-                    from podman_runner.helpers import tmp_path_factory_safe
+    rmtree_mock = MagicMock()
+    monkeypatch.setattr("tempfile.mkdtemp", lambda *a, **k: "/mock/tmp_dir")
+    monkeypatch.setattr(Path, "is_dir", lambda self: True)
+    monkeypatch.setattr(Path, "exists", lambda self: True)
+    monkeypatch.setattr("shutil.rmtree", rmtree_mock)
 
-                    with tmp_path_factory_safe("test") as path:
-                        assert str(path) == "/mock/tmp_dir"
-                    rmtree_mock.assert_called_once()
+    with tmp_path_factory_safe("test") as path:
+        assert str(path) == "/mock/tmp_dir"
+    rmtree_mock.assert_called_once()
 
 
-def test_tmp_path_factory_safe_mkdtemp_fails() -> None:
+def test_tmp_path_factory_safe_mkdtemp_fails(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test tmp_path_factory_safe when mkdtemp fails."""
-    with patch("tempfile.mkdtemp", side_effect=OSError("Disk full")):
-        from podman_runner.helpers import tmp_path_factory_safe
 
-        with pytest.raises(RuntimeError, match="Failed to create temporary directory"):
-            with tmp_path_factory_safe("test"):
-                pass
+    def boom(*a: object, **k: object) -> str:
+        raise OSError("Disk full")
 
+    monkeypatch.setattr("tempfile.mkdtemp", boom)
+    with pytest.raises(RuntimeError, match="Failed to create temporary directory"):
+        with tmp_path_factory_safe("test"):
+            pass
 
-def test_tmp_path_factory_safe_rmtree_fails() -> None:
+
+def test_tmp_path_factory_safe_rmtree_fails(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test tmp_path_factory_safe when rmtree fails."""
-    with patch("tempfile.mkdtemp", return_value="/mock/tmp_dir"):
-        with patch("pathlib.Path.is_dir", return_value=True):
-            with patch("pathlib.Path.exists", return_value=True):
-                with patch("shutil.rmtree", side_effect=Exception("Permission denied")):
-                    with patch("warnings.warn") as warn_mock:
-                        from podman_runner.helpers import tmp_path_factory_safe
-
-                        with tmp_path_factory_safe("test"):
-                            pass
-                        warn_mock.assert_called_once()
+
+    def boom(*a: object, **k: object) -> None:
+        raise RuntimeError("Permission denied")
+
+    warn_mock = MagicMock()
+    monkeypatch.setattr("tempfile.mkdtemp", lambda *a, **k: "/mock/tmp_dir")
+    monkeypatch.setattr(Path, "is_dir", lambda self: True)
+    monkeypatch.setattr(Path, "exists", lambda self: True)
+    monkeypatch.setattr("shutil.rmtree", boom)
+    monkeypatch.setattr("warnings.warn", warn_mock)
+
+    with tmp_path_factory_safe("test"):
+        pass
+    warn_mock.assert_called_once()